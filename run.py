@@ -38,7 +38,18 @@ def main():
     logger.info(f"Running {module}")
 
     try:
-        importlib.import_module(module)
+        profiler = config.get("profile.profiler", ignore_errors=True)
+        if profiler:
+            from src.utils.profiling import profile
+            profile(
+                lambda: importlib.import_module(module),
+                profiler,
+                config.get("profile.output", "profiles"),
+                config.get("profile.top", 30),
+                config.get("profile.interval", 0.005),
+            )
+        else:
+            importlib.import_module(module)
     except Exception as e:
         logger.exception(e)
         raise e
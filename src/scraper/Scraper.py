@@ -1,11 +1,15 @@
 import copy
+import threading
 import time
 from typing import List, Callable, Dict, Optional, Union, Tuple
 
-from src.scraper.modules import ScraperModule, WatchModule, OpenModule, ReturnModule
+from src.scraper.modules import ScraperModule, WatchModule, PushModule, OpenModule, ReturnModule
+from src.scraper.modules.module import ScraperArchiveExhausted, ScraperModuleError
+from src.scraper.sinks import create_sinks
 from src.scraper.types import TickerPayload, ScraperComponent, ScraperEntity
 from src.utils import config, telemetry
-from src.utils.logging import logger
+from src.utils.logging import logger, bundle
+from src.utils.memory import MemoryReporter
 
 
 class ScraperPayload(TickerPayload):
@@ -18,6 +22,7 @@ class ScraperPayload(TickerPayload):
 class Scraper:
 
     modules: List[Tuple[ScraperModule, Dict]] = []
+    listeners: List[threading.Thread] = []
 
     def __init__(self,
                  callback: Callable[[TickerPayload], None],
@@ -26,11 +31,37 @@ class Scraper:
         self.callback = callback
         self.settings = settings
         self.wait_time = config.get("scraping.wait_time", 1)
+        if config.get("scraping.archive.mode", ignore_errors=True) == "replay":
+            self.wait_time = 0  # Replay is paced by scraping.archive.timing
+        self.callback_lock = threading.Lock()
+        self.sinks = create_sinks(config.get("scraping.sinks", []))
+        self.memory = MemoryReporter(config.get("scraping.memory_report", {}))
 
         logger.info([s["entity"]["name"] for s in settings])
 
-        for component in settings:
-            self.modules.append(self.initialize_component(component))
+        for sink in self.sinks:
+            sink.start()
+
+        try:
+            for component in settings:
+                module = self.initialize_component(component)
+                if isinstance(module[0], PushModule):
+                    self.listeners.append(self.start_listener(module))
+                else:
+                    self.modules.append(module)
+
+            self.run()
+        except ScraperArchiveExhausted as e:
+            logger.info(bundle("Replay finished", reason=str(e)))
+        finally:
+            for sink in self.sinks:
+                sink.close()
+
+    def run(self):
+        if not self.modules:
+            for listener in self.listeners:
+                listener.join()
+            return
 
         i = 0
         while True:
@@ -40,11 +71,38 @@ class Scraper:
                     with telemetry.tracer.start_as_current_span("Module run") as module_span:
                         module_span.set_attribute("index", i)
                         module_span.set_attribute("entity", copy.deepcopy(module[1].get("entity", {}).get("name", "")))
-                        result = module[0].run(copy.deepcopy(module[1]))
+                        try:
+                            with self.memory.track(module[1].get("entity", {}).get("name", str(i))):
+                                result = module[0].run(copy.deepcopy(module[1]))
+                        except ScraperArchiveExhausted:
+                            raise
+                        except ScraperModuleError as e:
+                            logger.warning(bundle("Skipping component for this tick", index=i, error=repr(e)))
+                            result = {}
                         if result:
-                            callback(ScraperPayload(result))
+                            self.emit(result)
 
-                    time.sleep(self.wait_time)
+                    if self.wait_time:
+                        time.sleep(self.wait_time)
+
+    def emit(self, result: Dict):
+        with self.callback_lock:
+            for sink in self.sinks:
+                sink.write(result)
+
+            self.callback(ScraperPayload(result))
+
+    def start_listener(self, module: Tuple[ScraperModule, Dict]) -> threading.Thread:
+        name = module[1].get("entity", {}).get("name", "")
+
+        listener = threading.Thread(
+            target=module[0].listen,  # type: ignore
+            args=(module[1], self.emit, lambda: self.memory.track(name)),
+            name=f"push-{name}",
+            daemon=True,
+        )
+        listener.start()
+        return listener
 
     def initialize_component(self, component: ScraperComponent) -> Tuple[ScraperModule, Dict]:
         entity: Union[ScraperEntity, Dict] = {}
@@ -60,6 +118,8 @@ class Scraper:
             module: Optional[ScraperModule] = None
             if step["action"] == "watch":
                 module = WatchModule(previous, step, config.get("scraping.mock", False))
+            elif step["action"] == "push":
+                module = PushModule(previous, step)
             elif step["action"] == "open":
                 module = OpenModule(previous, step)
             elif step["action"] == "return":
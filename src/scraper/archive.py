@@ -0,0 +1,119 @@
+import json
+import mmap
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src import ROOT_PATH
+from src.scraper.modules.module import ScraperArchiveExhausted, ScraperModuleError, ScraperRateLimitError
+from src.utils import config
+from src.utils.logging import logger, bundle
+
+
+_ERRORS = {error.__name__: error for error in (ScraperModuleError, ScraperRateLimitError)}
+
+
+class HttpArchive:
+    """Record/replay archive of responses: zlib bodies in ``<path>.data``, JSON lines in ``<path>.index``."""
+
+    def __init__(self, path: str, mode: str, timing: bool = False):
+        self.path = os.path.join(ROOT_PATH, path)
+        self.mode = mode
+        self.timing = timing
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+
+        if mode == "record":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.data = open(f"{self.path}.data", "wb")
+            self.index = open(f"{self.path}.index", "w")
+            self.offset = 0
+        elif mode == "replay":
+            self.entries: Dict[str, Deque[Dict]] = defaultdict(deque)
+            with open(f"{self.path}.index") as index:
+                for line in index:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[entry["url"]].append(entry)
+
+            with open(f"{self.path}.data", "rb") as data:
+                self.mapped: Optional[mmap.mmap] = None
+                if os.fstat(data.fileno()).st_size > 0:
+                    self.mapped = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+
+            logger.info(bundle("Replaying archive", path=self.path, urls=len(self.entries)))
+        else:
+            raise ValueError(f"Unknown archive mode {mode}")
+
+    def record(self, url: str, response: Optional[requests.Response], error: Optional[Exception] = None):
+        content = b""
+        if response is not None and error is None:
+            content = response._content or b""  # Not consumed for discarded streamed responses
+        compressed = zlib.compress(content)
+        with self.lock:
+            self.data.write(compressed)
+            self.data.flush()
+            self.index.write(json.dumps({
+                "url": url,
+                "status": response.status_code if response is not None else None,
+                "headers": dict(response.headers) if response is not None else {},
+                "encoding": response.encoding if response is not None else None,
+                "error": {"type": type(error).__name__, "message": str(error)} if error is not None else None,
+                "offset": self.offset,
+                "length": len(compressed),
+                "time": time.monotonic() - self.started,
+            }) + "\n")
+            self.index.flush()
+            self.offset += len(compressed)
+
+    def replay(self, url: str) -> requests.Response:
+        with self.lock:
+            if not self.entries.get(url):
+                raise ScraperArchiveExhausted(f"No more archived responses for {url}")
+            entry = self.entries[url].popleft()
+
+        if self.timing:
+            wait = self.started + entry["time"] - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+        if entry.get("error"):
+            raise _ERRORS.get(entry["error"]["type"], ScraperModuleError)(entry["error"]["message"])
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry["encoding"]
+        response._content = b""
+        if self.mapped is not None and entry["length"]:
+            response._content = zlib.decompress(self.mapped[entry["offset"]:entry["offset"] + entry["length"]])
+
+        return response
+
+
+_archive: Optional[HttpArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[HttpArchive]:
+    global _archive
+    mode = config.get("scraping.archive.mode", ignore_errors=True)
+    if not mode:
+        return None
+
+    with _archive_lock:
+        if _archive is None:
+            _archive = HttpArchive(
+                config.get("scraping.archive.path", "archives/scraper"),
+                mode,
+                config.get("scraping.archive.timing", False),
+            )
+
+    return _archive
@@ -0,0 +1,118 @@
+import datetime
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+
+from src.scraper.modules.module import ScraperRateLimitError
+from src.utils import config, telemetry
+from src.utils.logging import logger, bundle
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long the caller has to wait for it."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class RateLimiter:
+    """Per-host token buckets shared by all components, plus a global in-flight budget."""
+
+    def __init__(self, settings: Optional[Dict] = None):
+        settings = settings or {}
+        self.default = settings.get("default") or {}
+        self.hosts = settings.get("hosts") or {}
+
+        self.lock = threading.Lock()
+        self.in_flight = threading.BoundedSemaphore(settings.get("max_in_flight", 8))
+        self.max_retry_after = settings.get("max_retry_after", 30)
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.waited: Dict[str, float] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        if host not in self.buckets:
+            settings = self.hosts.get(host) or self.default
+            self.buckets[host] = TokenBucket(settings.get("rate", 5), settings.get("burst", 5))
+
+        return self.buckets[host]
+
+    @contextmanager
+    def acquire(self, host: str) -> Iterator[float]:
+        with telemetry.tracer.start_as_current_span("rate limiter") as span:
+            start = time.monotonic()
+            with self.lock:
+                bucket = self.bucket(host)
+                blocked = bucket.blocked_until - start
+                if blocked > self.max_retry_after:
+                    raise ScraperRateLimitError(f"{host} is rate limited for another {blocked:.0f} s")
+                wait = bucket.reserve()
+            if wait > 0:
+                time.sleep(wait)
+
+            self.in_flight.acquire()
+            waited = time.monotonic() - start
+            with self.lock:
+                self.waited[host] = self.waited.get(host, 0.0) + waited
+
+            span.set_attribute("host", host)
+            span.set_attribute("wait_ms", waited * 1000)
+            span.set_attribute("host_wait_total_ms", self.waited[host] * 1000)
+
+        try:
+            yield waited
+        finally:
+            self.in_flight.release()
+
+    def retry_after(self, host: str, value: Optional[str], attempt: int = 0) -> float:
+        """Blocks the host for ``Retry-After``, or an exponential backoff without it, and returns the delay."""
+        backoff = config.get("scraping.rate_limit.retry_after", 1) * 2 ** attempt
+        delay = parse_retry_after(value, backoff)
+        with self.lock:
+            bucket = self.bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+
+        logger.warning(bundle("Host is rate limiting", host=host, retry_after=delay))
+        return delay
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    if not value:
+        return default
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+        return max((date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(config.get("scraping.rate_limit", {}))
+
+    return _limiter
@@ -1,4 +1,5 @@
 from .module import ScraperModule
 from .watch import WatchModule
 from .open import OpenModule
+from .push import PushModule
 from .ret import ReturnModule
@@ -17,3 +17,11 @@ class ScraperModule(ABC):
 
 class ScraperModuleError(Exception):
     pass
+
+
+class ScraperRateLimitError(ScraperModuleError):
+    pass
+
+
+class ScraperArchiveExhausted(ScraperModuleError):
+    pass
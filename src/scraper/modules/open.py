@@ -2,14 +2,16 @@ import json
 import re
 from abc import ABC, abstractmethod
 from typing import Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import pydash
 import requests
 from lxml import etree
 from random_user_agent.user_agent import UserAgent
 
-from src.scraper.modules.module import ScraperModule, ScraperModuleError
+from src.scraper.archive import get_archive
+from src.scraper.limiter import get_limiter
+from src.scraper.modules.module import ScraperModule, ScraperModuleError, ScraperRateLimitError
 from src.scraper.types import get_target
 from src.utils import config, telemetry
 from src.utils.logging import logger, bundle
@@ -20,10 +22,13 @@ class Body(ABC):
     def get(self, path: str) -> str:
         return ""
 
+    def release(self):
+        pass
+
 
 class JsonBody(Body):
-    def __init__(self, response: requests.Response):
-        self.parsed = json.loads(response.text.encode("ascii", "ignore").decode())
+    def __init__(self, text: str):
+        self.parsed = json.loads(text.encode("ascii", "ignore").decode())
 
     def get(self, path):
         value = pydash.get(self.parsed, path)
@@ -31,16 +36,19 @@ class JsonBody(Body):
 
         return value
 
+    def release(self):
+        self.parsed = None
+
 
 class XmlBody(Body):
-    def __init__(self, response: requests.Response, _type: str):
+    def __init__(self, text: str, _type: str):
         if _type == "html":
             self.tree = etree.HTML(
-                response.text[response.text.find("<html"):],
+                text[text.find("<html"):],
             )
         elif _type == "rss":
             self.tree = etree.XML(
-                response.text[response.text.find("<rss"):],
+                text[text.find("<rss"):],
             )
             
     def get(self, path):
@@ -60,6 +68,9 @@ class XmlBody(Body):
 
         return parsed
 
+    def release(self):
+        self.tree = None
+
 
 class OpenModule(ScraperModule):
 
@@ -67,6 +78,8 @@ class OpenModule(ScraperModule):
         super().__init__(next_step, settings)
 
         self.user_agent = UserAgent()
+        self.bounded_memory = config.get("scraping.bounded_memory", False)
+        self.max_bytes = settings.get("max_bytes") or config.get("scraping.max_response_bytes", 10 * 1024 * 1024)
 
         if config.get("scraping.use_sessions", True):
             self.session = requests.session()
@@ -85,6 +98,9 @@ class OpenModule(ScraperModule):
 
             store["_prev"] = self.settings
 
+            body.release()
+            del response, body  # Only the extracted values are kept while the rest of the chain runs
+
         return self.next_step.run(store)
 
     def _make_request(self, store) -> requests.Response:
@@ -99,25 +115,82 @@ class OpenModule(ScraperModule):
         if not url:
             url = target
 
-        response = self.session.get(
-            url,
-            headers={"user-agent": config.get("scraping.user_agent", self.user_agent.get_random_user_agent())},
-        )
-
-        if response.status_code == 200:
-            return response
+        archive = get_archive()
+        limiter = get_limiter()
+        host = urlparse(url).netloc
+        retries = config.get("scraping.rate_limit.retries", 1)
+        for attempt in range(retries + 1):
+            if archive is not None and archive.mode == "replay":
+                response = archive.replay(url)
+            else:
+                response = None
+                error: Optional[ScraperModuleError] = None
+                try:
+                    with limiter.acquire(host):
+                        response = self.session.get(
+                            url,
+                            headers={"user-agent": config.get("scraping.user_agent", self.user_agent.get_random_user_agent())},
+                            stream=self.bounded_memory,
+                        )
+                        if self.bounded_memory and response.status_code == 200:
+                            self._read_bounded(response)
+                        elif self.bounded_memory:
+                            response.close()
+                except requests.RequestException as e:
+                    error = ScraperModuleError(f"Request to {url} failed: {e!r}")
+                except ScraperModuleError as e:
+                    error = e
+
+                if archive is not None:
+                    archive.record(url, response, error)
+                if error is not None:
+                    raise error
+
+            if response.status_code == 200:
+                return response
+
+            if response.status_code not in (429, 503):
+                break
+
+            delay = limiter.retry_after(host, response.headers.get("Retry-After"), attempt)
+            if attempt == retries or delay > limiter.max_retry_after:
+                raise ScraperRateLimitError(response)
 
         raise ScraperModuleError(response)
 
+    def _read_bounded(self, response: requests.Response):
+        """Downloads a streamed response, failing as soon as it grows over ``max_bytes``."""
+        try:
+            try:
+                length = int(response.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = 0  # Unknown, enforced while reading
+            if length > self.max_bytes:
+                raise ScraperModuleError(f"Response from {response.url} exceeds {self.max_bytes} bytes")
+
+            content = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                content += chunk
+                if len(content) > self.max_bytes:
+                    raise ScraperModuleError(f"Response from {response.url} exceeds {self.max_bytes} bytes")
+
+            response._content = content  # type: ignore  # Kept as bytearray to avoid copying it
+        finally:
+            response.close()
+
     def _extract_body(self, response: requests.Response) \
             -> Optional[Body]:
         # with telemetry.tracer.start_as_current_span("extract body"):
-        body: Optional[Body] = None
-        if "application/json" in response.headers["Content-Type"]:
-            body = JsonBody(response)
-        elif "text/html" in response.headers["Content-Type"]:
-            body = XmlBody(response, "html")
-        elif "application/rss+xml" in response.headers["Content-Type"]:
-            body = XmlBody(response, "rss")
-
-        return body
+        return parse_body(response.text, response.headers["Content-Type"])
+
+
+def parse_body(text: str, content_type: str) -> Optional[Body]:
+    body: Optional[Body] = None
+    if "application/json" in content_type:
+        body = JsonBody(text)
+    elif "text/html" in content_type:
+        body = XmlBody(text, "html")
+    elif "application/rss+xml" in content_type:
+        body = XmlBody(text, "rss")
+
+    return body
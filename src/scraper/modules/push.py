@@ -0,0 +1,169 @@
+import contextlib
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, ContextManager, Dict, Iterator, Optional, Tuple
+
+import pydash
+import requests
+import websocket
+
+from src.scraper.modules.module import ScraperModule, ScraperModuleError
+from src.scraper.modules.open import parse_body
+from src.scraper.types import ScraperPushStep, get_target
+from src.utils import config, telemetry
+from src.utils.logging import logger, bundle
+
+
+class PushModule(ScraperModule):
+    """Watch step fed by a persistent WebSocket or Server-Sent Events connection."""
+
+    settings: ScraperPushStep
+
+    def __init__(self, next_step, settings: ScraperPushStep):
+        super().__init__(next_step, settings)
+
+        self.url = get_target(settings["target"], {})
+        if self.url is None:
+            raise ScraperModuleError("Push target must be an url")
+
+        self.protocol = settings.get("protocol") or ("websocket" if self.url.startswith("ws") else "sse")
+        self.content_type = settings.get("content_type", "application/json")
+        self.reconnect_delay = config.get("scraping.push.reconnect_delay", 1)
+        self.reconnect_max_delay = config.get("scraping.push.reconnect_max_delay", 60)
+        self.history_size = config.get("scraping.push.history_size", 1000)
+        self.read_timeout = config.get("scraping.push.read_timeout", 60)
+        self.ping_interval = config.get("scraping.push.ping_interval", 20)
+
+        self.seen: OrderedDict = OrderedDict()
+        self.last_event_id: Optional[str] = None
+        self.stopped = threading.Event()
+
+    def run(self, store):
+        raise ScraperModuleError("Push module is driven by its connection, use listen() instead")
+
+    def listen(self, store: Dict, callback: Callable[[Dict], None],
+               track: Callable[[], ContextManager] = contextlib.nullcontext):
+        delay = self.reconnect_delay
+        while not self.stopped.is_set():
+            try:
+                for message in self._messages():
+                    delay = self.reconnect_delay
+                    with telemetry.tracer.start_as_current_span("Module push") as module_span:
+                        module_span.set_attribute("entity", pydash.get(store, "entity.name", ""))
+                        try:
+                            with track():
+                                result = self.on_message(copy.deepcopy(store), message)
+                            if result:
+                                callback(result)
+                        except Exception as e:
+                            logger.exception(e)
+
+                    if self.stopped.is_set():
+                        return
+            except Exception as e:
+                logger.warning(bundle("Push connection lost", url=self.url, error=repr(e), retry_in=delay))
+
+            self.stopped.wait(delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+    def stop(self):
+        self.stopped.set()
+
+    def on_message(self, store: Dict, message: str) -> Dict:
+        with telemetry.tracer.start_as_current_span("push module") as span:
+            logger.debug(bundle(self.__class__.__name__, settings=self.settings))
+
+            body = parse_body(message, self.content_type)
+            if body is None:
+                raise ScraperModuleError(f"Unsupported push content type {self.content_type}")
+
+            elements = self.settings["target"].get("elements") or []
+            values = tuple(body.get(element) for element in elements)
+            if elements:
+                if values in self.seen:
+                    return {}
+                self.seen[values] = None
+                if len(self.seen) > self.history_size:
+                    self.seen.popitem(last=False)
+
+            for key in ((self.settings.get("store") or {}).keys()):
+                pydash.set_(store, key, body.get(self.settings["store"][key]))
+
+            store["_prev"] = self.settings
+
+            body.release()
+            del body
+
+            span.end()
+            return self.next_step.run(store)
+
+    def _messages(self) -> Iterator[str]:
+        if self.protocol == "websocket":
+            return self._websocket_messages()
+        if self.protocol == "sse":
+            return self._sse_messages()
+
+        raise ScraperModuleError(f"Unknown push protocol {self.protocol}")
+
+    def _websocket_messages(self) -> Iterator[str]:
+        connection = websocket.create_connection(self.url, timeout=self.ping_interval)
+        try:
+            logger.info(bundle("Push connection opened", url=self.url))
+            if self.settings.get("subscribe"):
+                connection.send(self.settings["subscribe"])
+
+            received = time.monotonic()
+            while not self.stopped.is_set():
+                try:
+                    opcode, message = connection.recv_data(control_frame=True)
+                except websocket.WebSocketTimeoutException:
+                    if time.monotonic() - received > self.read_timeout:
+                        raise ScraperModuleError(f"No data from {self.url} for {self.read_timeout} s")
+                    connection.ping()
+                    continue
+
+                received = time.monotonic()
+                if opcode == websocket.ABNF.OPCODE_CLOSE:
+                    return
+                if opcode in (websocket.ABNF.OPCODE_TEXT, websocket.ABNF.OPCODE_BINARY) and message:
+                    yield message.decode() if isinstance(message, bytes) else message
+        finally:
+            connection.close()
+
+    def _sse_messages(self) -> Iterator[str]:
+        headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+
+        with requests.get(self.url, headers=headers, stream=True, timeout=(10, self.read_timeout)) as response:
+            if response.status_code != 200:
+                raise ScraperModuleError(response)
+
+            logger.info(bundle("Push connection opened", url=self.url, last_event_id=self.last_event_id))
+            for event_id, data in _parse_sse(response.iter_lines(decode_unicode=True)):
+                if event_id is not None:
+                    self.last_event_id = event_id
+                yield data
+
+
+def _parse_sse(lines: Iterator[str]) -> Iterator[Tuple[Optional[str], str]]:
+    event_id: Optional[str] = None
+    data = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event_id, "\n".join(data)
+            event_id, data = None, []
+            continue
+
+        if line.startswith(":"):
+            continue
+
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "data":
+            data.append(value)
+        elif field == "id":
+            event_id = value
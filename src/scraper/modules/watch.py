@@ -36,6 +36,9 @@ class WatchModule(OpenModule):
 
                     store["_prev"] = self.settings
 
+                    body.release()
+                    del body
+
                     span.end()
                     return self.next_step.run(store)
 
@@ -0,0 +1,18 @@
+from typing import Dict, List
+
+from .sink import Sink, ScraperSinkError
+from .file import FileSink
+from .bigquery import BigQuerySink
+
+
+def create_sinks(settings: List[Dict]) -> List[Sink]:
+    sinks: List[Sink] = []
+    for sink_settings in settings:
+        if sink_settings["type"] == "file":
+            sinks.append(FileSink(sink_settings))
+        elif sink_settings["type"] == "bigquery":
+            sinks.append(BigQuerySink(sink_settings))
+        else:
+            raise ScraperSinkError(f"Unknown sink type {sink_settings['type']}")
+
+    return sinks
@@ -0,0 +1,61 @@
+import json
+import uuid
+from typing import Any, Dict, List, Tuple
+
+from google.api_core import exceptions  # type: ignore
+from google.cloud import bigquery  # type: ignore
+from google.oauth2 import service_account  # type: ignore
+
+from src.scraper.sinks.sink import Sink, payload_key
+from src.utils import config
+from src.utils.logging import logger, bundle
+
+
+class BigQuerySink(Sink):
+    """Streams payloads into the BigQuery ``table`` using ``entity.name:id`` as insert id."""
+
+    def __init__(self, settings: Dict):
+        super().__init__(settings)
+
+        self.table = settings["table"]
+        self.order_by = settings.get("order_by", "timestamp")
+
+        credentials = service_account.Credentials.from_service_account_info(
+            json.loads(str(config.get("secret.gcp.bigquery.credentials"))),
+        )
+        self.bq = bigquery.Client(credentials=credentials)
+
+    def _flush(self, rows: List[Dict]) -> Dict[int, Any]:
+        row_ids = []
+        for row in rows:
+            key = payload_key(row)
+            row_ids.append(":".join(key) if key is not None else str(uuid.uuid4()))
+
+        errors = self.bq.insert_rows_json(
+            self.table,
+            json.loads(json.dumps(rows, default=str)),
+            row_ids=row_ids,
+            skip_invalid_rows=True,
+        )
+        return {error["index"]: error["errors"] for error in errors}
+
+    def _is_permanent(self, error: Exception) -> bool:
+        return isinstance(error, exceptions.ClientError) and not isinstance(error, exceptions.TooManyRequests)
+
+    def _load_keys(self) -> List[Tuple]:
+        order = f"ORDER BY MAX({self.order_by}) DESC" if self.order_by else ""
+        query = f"""
+            SELECT entity.name AS name, CAST(id AS STRING) AS id
+            FROM `{self.table}`
+            WHERE id IS NOT NULL
+            GROUP BY name, id
+            {order}
+            LIMIT {int(self.history_size)}
+        """
+        try:
+            rows = list(self.bq.query(query).result())
+        except Exception as e:
+            logger.warning(bundle("Could not load written keys", sink=self.name, table=self.table, error=repr(e)))
+            return []
+
+        return [(str(row["name"] or ""), row["id"]) for row in reversed(rows)]
@@ -0,0 +1,105 @@
+import datetime
+import glob
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+
+from src import ROOT_PATH
+from src.scraper.sinks.sink import Sink, payload_key
+from src.utils.logging import logger, bundle
+
+
+class FileSink(Sink):
+    """Writes payloads to rotating ``jsonl`` or ``parquet`` (requires ``pyarrow``) files."""
+
+    def __init__(self, settings: Dict):
+        super().__init__(settings)
+
+        self.path = os.path.join(ROOT_PATH, settings.get("path", "output"))
+        self.prefix = settings.get("prefix", "payloads")
+        self.format = settings.get("format", "jsonl")
+        self.rotate_rows = settings.get("rotate_rows", 100000)
+        self.rotate_interval = settings.get("rotate_interval", 3600)
+
+        if self.format not in ("jsonl", "parquet"):
+            raise ValueError(f"Unknown file sink format {self.format}")
+        if self.format == "parquet":
+            import pyarrow  # noqa: F401
+
+        os.makedirs(self.path, exist_ok=True)
+
+        self.file_path = ""
+        self.file_rows = 0
+        self.file_opened = 0.0
+        self.parquet_writer = None
+
+    def _flush(self, rows: List[Dict]):
+        if not self.file_path \
+                or self.file_rows >= self.rotate_rows \
+                or time.monotonic() - self.file_opened >= self.rotate_interval:
+            self._rotate()
+
+        if self.format == "jsonl":
+            with open(self.file_path, "a") as file:
+                file.writelines(json.dumps(row, default=str) + "\n" for row in rows)
+        else:
+            self._write_parquet(rows)
+
+        self.file_rows += len(rows)
+
+    def _rotate(self):
+        self._close()
+
+        timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        self.file_path = os.path.join(self.path, f"{self.prefix}-{timestamp}.{self.format}")
+        self.file_rows = 0
+        self.file_opened = time.monotonic()
+        logger.info(bundle("Rotating sink file", sink=self.name, path=self.file_path))
+
+    def _write_parquet(self, rows: List[Dict]):
+        import pyarrow
+        import pyarrow.parquet
+
+        schema = pyarrow.Table.from_pylist(rows).schema
+        if self.parquet_writer is not None:
+            try:
+                schema = pyarrow.unify_schemas([self.parquet_writer.schema, schema])
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                pass
+
+            if not schema.equals(self.parquet_writer.schema):
+                # New columns or promoted types (e.g. from null) can't be appended to the open file
+                self._rotate()
+
+        if self.parquet_writer is None:
+            self.parquet_writer = pyarrow.parquet.ParquetWriter(self.file_path, schema)
+
+        self.parquet_writer.write_table(pyarrow.Table.from_pylist(rows, schema=schema))
+
+    def _close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+            self.parquet_writer = None
+
+    def _load_keys(self) -> List[Tuple]:
+        keys: List[Tuple] = []
+        paths = sorted(glob.glob(os.path.join(self.path, f"{self.prefix}-*.{self.format}")), reverse=True)
+        for path in paths:
+            if len(keys) >= self.history_size:
+                break
+
+            try:
+                keys = [key for key in map(payload_key, self._read_rows(path)) if key is not None] + keys
+            except Exception as e:
+                logger.warning(bundle("Could not read sink file", sink=self.name, path=path, error=repr(e)))
+
+        return keys[-self.history_size:]
+
+    def _read_rows(self, path: str) -> List[Dict]:
+        if self.format == "jsonl":
+            with open(path) as file:
+                return [json.loads(line) for line in file if line.strip()]
+
+        import pyarrow.parquet
+        return pyarrow.parquet.read_table(path, columns=["entity", "id"]).to_pylist()
@@ -0,0 +1,153 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pydash
+
+from src.utils.logging import logger, bundle
+
+_CLOSE = object()
+
+
+def payload_key(payload: Dict) -> Optional[Tuple]:
+    if payload.get("id") is None:
+        return None
+
+    return str(pydash.get(payload, "entity.name") or ""), str(payload["id"])
+
+
+class Sink(ABC):
+    """Buffered payload writer flushing batches from a background thread."""
+
+    def __init__(self, settings: Dict):
+        self.settings = settings
+        self.name = settings.get("name", settings["type"])
+        self.batch_size = settings.get("batch_size", 100)
+        self.flush_interval = settings.get("flush_interval", 10)
+        self.max_pending = settings.get("max_pending", 10000)
+        self.history_size = settings.get("history_size", 10000)
+        self.retry_delay = settings.get("retry_delay", 1)
+        self.max_retry_delay = settings.get("max_retry_delay", 60)
+        self.max_retries = settings.get("max_retries", 5)
+
+        self.lock = threading.Lock()
+        self.seen: OrderedDict = OrderedDict()
+        self.pending: Set[Tuple] = set()
+        self.closing = threading.Event()
+        self.queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self.writer = threading.Thread(target=self._run, name=f"sink-{self.name}", daemon=True)
+
+    def start(self):
+        with self.lock:
+            for key in self._load_keys():
+                self._remember(key)
+
+        self.writer.start()
+
+    def write(self, payload: Dict):
+        key = payload_key(payload)
+        if key is not None:
+            with self.lock:
+                if key in self.seen or key in self.pending:
+                    logger.debug(bundle("Skipping duplicate payload", sink=self.name, key=key))
+                    return
+                self.pending.add(key)
+
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            logger.warning(bundle("Sink is falling behind, blocking producer", sink=self.name))
+            self.queue.put(payload)
+
+    def close(self):
+        self.closing.set()
+        self.queue.put(_CLOSE)
+        self.writer.join()
+
+    def _remember(self, key: Tuple):
+        self.seen[key] = None
+        if len(self.seen) > self.history_size:
+            self.seen.popitem(last=False)
+
+    def _run(self):
+        batch: List[Dict] = []
+        deadline = time.monotonic() + self.flush_interval
+        closed = False
+        while not closed:
+            try:
+                item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                if item is _CLOSE:
+                    closed = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            if batch and (closed or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                batch = self._flush_with_retry(batch)
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+        if batch:
+            logger.warning(bundle("Dropping unflushed payloads", sink=self.name, count=len(batch)))
+            self._forget(batch)
+
+        self._close()
+
+    def _flush_with_retry(self, batch: List[Dict]) -> List[Dict]:
+        # The queue is not drained while retrying, so a failing destination blocks the producer
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                rejected = self._flush(batch) or {}
+            except Exception as e:
+                if self._is_permanent(e) or attempt == self.max_retries:
+                    logger.error(bundle("Sink flush failed, dropping payloads", sink=self.name, count=len(batch),
+                                        attempts=attempt + 1, error=repr(e)))
+                    self._forget(batch)
+                    return []
+
+                logger.warning(bundle("Sink flush failed", sink=self.name, error=repr(e), retry_in=delay))
+                if self.closing.wait(delay):
+                    return batch
+                delay = min(delay * 2, self.max_retry_delay)
+                continue
+
+            for index, error in rejected.items():
+                logger.error(bundle("Sink rejected payload", sink=self.name, payload=batch[index], error=error))
+            self._forget(batch[index] for index in rejected)
+            with self.lock:
+                for index, row in enumerate(batch):
+                    key = payload_key(row)
+                    if key is not None and index not in rejected:
+                        self.pending.discard(key)
+                        self._remember(key)
+            return []
+
+        return []
+
+    def _forget(self, rows: Iterable[Dict]):
+        with self.lock:
+            for key in map(payload_key, rows):
+                self.pending.discard(key)
+
+    def _is_permanent(self, error: Exception) -> bool:
+        return False
+
+    def _load_keys(self) -> List[Tuple]:
+        return []
+
+    def _close(self):
+        pass
+
+    @abstractmethod
+    def _flush(self, rows: List[Dict]) -> Optional[Dict[int, Any]]:
+        """Writes the rows and returns the errors of rows rejected for good, by index."""
+        raise NotImplementedError()
+
+
+class ScraperSinkError(Exception):
+    pass
@@ -19,11 +19,17 @@ class ScraperTarget(TypedDict):
 
 
 class ScraperStep(TypedDict):
-    action: Literal["watch", "open", "return"]
+    action: Literal["watch", "push", "open", "return"]
     target: ScraperTarget
     store: Dict[str, str]
 
 
+class ScraperPushStep(ScraperStep, total=False):
+    protocol: Literal["websocket", "sse"]
+    content_type: str
+    subscribe: str
+
+
 class ScraperEntity(TypedDict):
     ticker: str
     name: str
@@ -0,0 +1,93 @@
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from opentelemetry import trace
+
+from src.utils.logging import logger, bundle
+
+
+class MemoryReporter:
+    """Periodic ``tracemalloc`` report of memory retained and peaked per component."""
+
+    def __init__(self, settings: Optional[Dict] = None):
+        settings = settings or {}
+        self.enabled = settings.get("enabled", False)
+        self.interval = settings.get("interval", 300)
+        self.top = settings.get("top", 10)
+
+        self.lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.active = 0
+        self.started = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.reported = time.monotonic()
+
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(settings.get("frames", 1))
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        # tracemalloc is process wide: runs overlapping another tracked run (e.g. a push listener)
+        # can't be attributed to one component, so they are only counted as shared
+        with self.lock:
+            self.active += 1
+            self.started += 1
+            started = self.started
+            shared = self.active > 1
+            if not shared:
+                tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            with self.lock:
+                after, peak = tracemalloc.get_traced_memory()
+                self.active -= 1
+                shared = shared or self.started != started
+
+                stats = self.stats.setdefault(name, {"runs": 0, "shared": 0, "retained": 0, "peak": 0})
+                stats["runs"] += 1
+                if shared:
+                    stats["shared"] += 1
+                else:
+                    stats["retained"] += after - before
+                    stats["peak"] = max(stats["peak"], peak - before)
+
+            span = trace.get_current_span()
+            span.set_attribute("memory.shared", shared)
+            if not shared:
+                span.set_attribute("memory.retained", after - before)
+                span.set_attribute("memory.peak", peak - before)
+
+            if time.monotonic() - self.reported >= self.interval:
+                self.report()
+
+    def report(self):
+        with self.lock:
+            self.reported = time.monotonic()
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ))
+
+            growth = []
+            if self.snapshot is not None:
+                growth = [str(stat) for stat in snapshot.compare_to(self.snapshot, "lineno")[:self.top]]
+            self.snapshot = snapshot
+
+            current, peak = tracemalloc.get_traced_memory()
+            logger.info(bundle(
+                "Memory report",
+                current=current,
+                peak=peak,
+                components=self.stats,
+                growth=growth,
+            ))
+            self.stats = {}
@@ -0,0 +1,102 @@
+import cProfile
+import datetime
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable
+
+from src import ROOT_PATH
+from src.utils.logging import logger, bundle
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread every ``interval`` seconds."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.own: Counter = Counter()
+        self.cumulative: Counter = Counter()
+        self.stacks: Counter = Counter()
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def __enter__(self):
+        self.sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stopped.set()
+        self.sampler.join()
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            top = f"{frame.f_code.co_name} ({os.path.relpath(frame.f_code.co_filename, ROOT_PATH)}:{frame.f_lineno})"
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.relpath(code.co_filename, ROOT_PATH)}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            self.samples += 1
+            self.own[top] += 1
+            self.cumulative.update(set(stack))
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def report(self, top: int) -> str:
+        out = io.StringIO()
+        out.write(f"{self.samples} samples every {self.interval * 1000:.1f} ms\n")
+        for title, counter in (("Self", self.own), ("Cumulative", self.cumulative)):
+            out.write(f"\n{title}:\n")
+            for name, count in counter.most_common(top):
+                out.write(f"{count / max(self.samples, 1) * 100:6.2f}% {count:8d}  {name}\n")
+
+        return out.getvalue()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+def profile(func: Callable[[], None], profiler: str, output: str = "profiles", top: int = 30,
+            interval: float = 0.005):
+    """Runs ``func`` under ``cprofile`` or the ``sampling`` profiler and dumps the hot spots to ``output``."""
+    path = os.path.join(ROOT_PATH, output)
+    os.makedirs(path, exist_ok=True)
+    name = os.path.join(path, f"{profiler}_{datetime.datetime.now().strftime('%Y%m%dT%H%M%S')}")
+
+    start = time.perf_counter()
+    if profiler == "cprofile":
+        cprofile = cProfile.Profile()
+        try:
+            cprofile.runcall(func)
+        finally:
+            cprofile.dump_stats(f"{name}.prof")
+            out = io.StringIO()
+            stats = pstats.Stats(cprofile, stream=out).strip_dirs()
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+            with open(f"{name}.txt", "w") as file:
+                file.write(out.getvalue())
+    elif profiler == "sampling":
+        sampler = SamplingProfiler(threading.get_ident(), interval)
+        try:
+            with sampler:
+                func()
+        finally:
+            with open(f"{name}.txt", "w") as file:
+                file.write(sampler.report(top))
+            with open(f"{name}.collapsed", "w") as file:
+                file.write(sampler.collapsed())
+    else:
+        raise ValueError(f"Unknown profiler {profiler}")
+
+    logger.info(bundle("Profile written", report=f"{name}.txt", duration=time.perf_counter() - start))